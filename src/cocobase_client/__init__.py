@@ -2,6 +2,12 @@
 # You can import from cocobase_client in your test files.
 
 from .client import CocoBaseClient
-from .exceptions import CocobaseError, InvalidApiKeyError
+from .exceptions import CocobaseApiError, CocobaseError, InvalidApiKeyError
 from .record import Record
 from .query import QueryBuilder
+
+try:
+    from .async_client import AsyncCocoBaseClient
+except ImportError:
+    # aiohttp is an optional dependency; the sync client works without it.
+    AsyncCocoBaseClient = None
@@ -0,0 +1,385 @@
+import asyncio
+
+import aiohttp
+
+from cocobase_client.client import _dumps, _loads
+from cocobase_client.config import BASEURL
+from cocobase_client.exceptions import CocobaseError
+from cocobase_client.query import QueryBuilder
+from cocobase_client.record import Collection, Record
+from cocobase_client.types import HttpMethod
+
+
+class AsyncCocoBaseClient:
+    """
+    An asyncio client for interacting with the CocoBase API.
+    Mirrors CocoBaseClient but lets independent requests run concurrently
+    on a single event loop instead of blocking per HTTP round-trip.
+    """
+
+    api_key = None
+    app_client_token = None
+
+    def __init__(self, api_key: str, token: str | None = None):
+        """
+        Initialize the AsyncCocoBaseClient with an API key and optional token.
+        """
+        self.api_key = api_key
+        self.app_client_token = token
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create the shared aiohttp session (must happen inside a running loop).
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+                headers={
+                    "x-api-key": self.api_key,
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._session
+
+    async def close(self):
+        """
+        Close the underlying aiohttp session and its pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def __request__(
+        self,
+        url,
+        method: HttpMethod = HttpMethod.get,
+        data: dict | None = None,
+        custom_headers: dict | None = None,
+    ) -> aiohttp.ClientResponse:
+        """
+        Internal method to send HTTP requests to the CocoBase API.
+        Handles GET and POST methods, and allows custom headers.
+        """
+        if not url.startswith("/"):
+            url = "/" + url
+        if method not in (
+            HttpMethod.get,
+            HttpMethod.post,
+            HttpMethod.delete,
+            HttpMethod.patch,
+        ):
+            raise ValueError(
+                "Invalid HTTP method. Use HttpMethod.get, HttpMethod.post, HttpMethod.delete, or HttpMethod.patch."
+            )
+        url = BASEURL + url
+        session = self._get_session()
+        return await session.request(
+            method.value.upper(),
+            url,
+            headers=custom_headers,
+            data=_dumps(data) if data is not None else None,
+        )
+
+    # ------------------- COLLECTION METHODS -------------------
+    async def create_collection(
+        self, collection_name, webhookurl: str | None = None
+    ) -> Collection | None:
+        """
+        Create a new collection with an optional webhook URL.
+        """
+        data = {"name": collection_name}
+        if webhookurl is not None:
+            data["webhook_url"] = webhookurl
+        req = await self.__request__("/collections/", method=HttpMethod.post, data=data)
+        if req.status == 400:
+            raise CocobaseError("Invalid Request: " + await req.text())
+        elif req.status == 422:
+            raise CocobaseError("A field is missing: " + await req.text())
+        elif req.status == 500:
+            raise CocobaseError("Internal Server Error")
+        elif req.status == 201:
+            return Collection(_loads(await req.read()))
+
+    async def update_collection(
+        self,
+        collection_id,
+        collection_name: str | None = None,
+        webhookurl: str | None = None,
+    ):
+        """
+        Update an existing collection's name and/or webhook URL.
+        """
+        data = dict()
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        if webhookurl is None and collection_name is None:
+            raise CocobaseError(
+                "At least one of webhook_url or collection_name must be provided."
+            )
+        if webhookurl is not None:
+            data["webhook_url"] = webhookurl
+        if collection_name is not None:
+            data["name"] = collection_name
+        req = await self.__request__(
+            f"/collections/{collection_id}", method=HttpMethod.post, data=data
+        )
+        if req.status == 400:
+            raise CocobaseError("Invalid Request: " + await req.text())
+        elif req.status == 422:
+            raise CocobaseError("A field is missing: " + await req.text())
+        elif req.status == 500:
+            raise CocobaseError("Internal Server Error")
+        elif req.status == 200:
+            return _loads(await req.read())
+
+    async def delete_collection(self, collection_id):
+        """
+        Delete a collection by its ID.
+        """
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        req = await self.__request__(
+            f"/collections/{collection_id}", method=HttpMethod.delete
+        )
+        if req.status == 400:
+            raise CocobaseError("Invalid Request: " + await req.text())
+        elif req.status == 422:
+            raise CocobaseError("A field is missing: " + await req.text())
+        elif req.status == 500:
+            raise CocobaseError("Internal Server Error")
+        elif req.status == 204:
+            return True
+
+    # ------------------- DOCUMENT METHODS -------------------
+    async def create_document(self, collection_id, data: dict) -> Record | None:
+        """
+        Create a new document in a collection.
+        """
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        if not isinstance(data, dict):
+            raise CocobaseError("Data must be a dictionary.")
+        req = await self.__request__(
+            f"/collections/documents?collection=" + collection_id,
+            method=HttpMethod.post,
+            data={"data": data},
+        )
+        if req.status == 400:
+            raise CocobaseError("Invalid Request: " + await req.text())
+        elif req.status == 422:
+            raise CocobaseError("A field is missing: " + await req.text())
+        elif req.status == 500:
+            raise CocobaseError("Internal Server Error")
+        elif req.status == 201:
+            return Record(_loads(await req.read()))
+
+    async def list_documents(
+        self, collection_id, query: QueryBuilder | None = None
+    ) -> list[Record] | None:
+        """
+        List all documents in a collection, optionally filtered by a query.
+        """
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        if query is not None and not isinstance(query, QueryBuilder):
+            raise CocobaseError("Query must be an instance of QueryBuilder.")
+        url = (
+            f"/collections/{collection_id}/documents?{query.build()}"
+            if query is not None
+            else f"/collections/{collection_id}/documents"
+        )
+        req = await self.__request__(url)
+        if req.status == 400:
+            raise CocobaseError("Invalid Request: " + await req.text())
+        elif req.status == 422:
+            raise CocobaseError("A field is missing: " + await req.text())
+        elif req.status == 500:
+            raise CocobaseError("Internal Server Error")
+        elif req.status == 200:
+            return Record.from_iter(_loads(await req.read()))
+
+    async def get_document(self, collection_id, document_id) -> Record | None:
+        """
+        Retrieve a single document by its ID from a collection.
+        """
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        if document_id is None:
+            raise CocobaseError("Document ID must be provided.")
+        req = await self.__request__(
+            f"/collections/{collection_id}/documents/{document_id}"
+        )
+        if req.status == 400:
+            raise CocobaseError("Invalid Request: " + await req.text())
+        elif req.status == 422:
+            raise CocobaseError("A field is missing: " + await req.text())
+        elif req.status == 500:
+            raise CocobaseError("Internal Server Error")
+        elif req.status == 200:
+            return Record(_loads(await req.read()))
+
+    async def bulk_get_documents(
+        self, collection_id, document_ids
+    ) -> list[Record | None]:
+        """
+        Fetch many documents concurrently; wall time is roughly one round-trip
+        instead of one per document.
+        """
+        return await asyncio.gather(
+            *[self.get_document(collection_id, i) for i in document_ids]
+        )
+
+    async def delete_document(self, collection_id, document_id) -> bool:
+        """
+        Delete a document from a collection by its ID.
+        """
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        if document_id is None:
+            raise CocobaseError("Document ID must be provided.")
+        req = await self.__request__(
+            f"/collections/{collection_id}/documents/{document_id}",
+            method=HttpMethod.delete,
+        )
+        if req.status == 400:
+            raise CocobaseError("Invalid Request: " + await req.text())
+        elif req.status == 422:
+            raise CocobaseError("A field is missing: " + await req.text())
+        elif req.status == 500:
+            raise CocobaseError("Internal Server Error")
+        elif req.status == 200 or req.status == 204:
+            return True
+        return False
+
+    async def update_document(
+        self, collection_id, document_id, data: dict
+    ) -> Record | None:
+        """
+        Update a document in a collection by its ID.
+        """
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        if document_id is None:
+            raise CocobaseError("Document ID must be provided.")
+        if not isinstance(data, dict):
+            raise CocobaseError("Data must be a dictionary.")
+        req = await self.__request__(
+            f"/collections/{collection_id}/documents/{document_id}",
+            method=HttpMethod.patch,
+            data={"data": data},
+        )
+        if req.status == 400:
+            raise CocobaseError("Invalid Request: " + await req.text())
+        elif req.status == 422:
+            raise CocobaseError("A field is missing: " + await req.text())
+        elif req.status == 500:
+            raise CocobaseError("Internal Server Error")
+        elif req.status == 200:
+            return Record(_loads(await req.read()))
+
+    # ------------------- AUTHENTICATION METHODS -------------------
+    def set_app_client_token(self, app_client_token: str):
+        """
+        Set the app client token for the client.
+        """
+        self.app_client_token = app_client_token
+
+    def is_authenticated(self) -> bool:
+        """
+        Check if the client is authenticated.
+        """
+        return self.app_client_token is not None
+
+    async def register(
+        self, email: str, password: str, data: dict | None = None
+    ) -> bool:
+        """
+        Register a new user with email, password, and optional extra data.
+        """
+        post_data = {
+            "email": email,
+            "password": password,
+        }
+        if data is not None and isinstance(data, dict):
+            post_data["data"] = data  # type: ignore
+        req = await self.__request__(
+            "/auth-collections/signup",
+            method=HttpMethod.post,
+            data=post_data,
+        )
+        if req.status == 200:
+            body = _loads(await req.read())
+            self.set_app_client_token(body.get("access_token"))
+            return body.get("access_token") is not None
+        else:
+            raise CocobaseError("Registration failed: " + await req.text())
+
+    async def login(self, email: str, password: str) -> bool:
+        """
+        Log in a user with email and password.
+        """
+        req = await self.__request__(
+            "/auth-collections/login",
+            method=HttpMethod.post,
+            data={"email": email, "password": password},
+        )
+        if req.status == 200:
+            body = _loads(await req.read())
+            self.set_app_client_token(body.get("access_token"))
+            return body.get("access_token") is not None
+        else:
+            raise CocobaseError("Login failed: " + await req.text())
+
+    def logout(self):
+        """
+        Log out the current user by clearing the app client token.
+        """
+        self.app_client_token = None
+
+    async def get_user_info(self) -> dict | None:
+        """
+        Get the current user's information. Requires authentication.
+        """
+        if not self.is_authenticated():
+            raise CocobaseError("Client is not authenticated.")
+        req = await self.__request__(
+            "/auth-collections/user",
+            method=HttpMethod.get,
+            custom_headers={"Authorization": f"Bearer {self.app_client_token}"},
+        )
+        if req.status == 200:
+            return _loads(await req.read())
+        else:
+            raise CocobaseError("Failed to get user info: " + await req.text())
+
+    async def update_user_info(self, email, password, data: dict) -> dict | None:
+        """
+        Update the current user's information. Requires authentication.
+        """
+        form_data = dict()
+        if email is not None:
+            form_data["email"] = email
+        if password is not None:
+            form_data["password"] = password
+        if data is not None and isinstance(data, dict):
+            form_data["data"] = data
+        if not self.is_authenticated():
+            raise CocobaseError("Client is not authenticated.")
+        if not isinstance(data, dict):
+            raise CocobaseError("Data must be a dictionary.")
+        req = await self.__request__(
+            "/auth-collections/user",
+            method=HttpMethod.patch,
+            data=form_data,
+            custom_headers={"Authorization": f"Bearer {self.app_client_token}"},
+        )
+        if req.status == 200:
+            return _loads(await req.read())
+        else:
+            raise CocobaseError("Failed to update user info: " + await req.text())
@@ -1,10 +1,61 @@
-from requests import Response, get, post,patch,put,delete
+import gzip
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from cocobase_client.config import BASEURL
-from cocobase_client.exceptions import CocobaseError
+from cocobase_client.exceptions import CocobaseApiError, CocobaseError
 from cocobase_client.query import QueryBuilder
 from cocobase_client.record import Collection, Record
 from cocobase_client.types import HttpMethod
 
+try:
+    # orjson decodes/encodes several times faster than the stdlib json module.
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+try:
+    # ijson enables incremental parsing of streamed list responses.
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # httpx provides the optional HTTP/2 transport (http2=True).
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    # Only advertise Brotli when it can actually be decoded locally.
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, br, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Request bodies above this size are gzipped before sending; below it the
+# compression overhead outweighs the bytes saved.
+_GZIP_THRESHOLD = 4096
+
+# Normalized once at import so request building is a single concatenation.
+_BASE = BASEURL.rstrip("/")
+
+# Error statuses shared by every endpoint, mapped to their message prefix.
+_ERROR_MAP = {
+    400: "Invalid Request: ",
+    422: "A field is missing: ",
+    500: "Internal Server Error",
+}
+
 
 class CocoBaseClient:
     """
@@ -15,12 +66,74 @@ class CocoBaseClient:
     api_key = None
     app_client_token = None
 
-    def __init__(self, api_key: str, token: str | None = None):
+    def __init__(
+        self,
+        api_key: str,
+        token: str | None = None,
+        http2: bool = False,
+        cache_documents: bool = False,
+        cache_size: int = 1024,
+    ):
         """
         Initialize the CocoBaseClient with an API key and optional token.
+        With http2=True (requires httpx) requests are multiplexed as HTTP/2
+        streams over one TLS connection, which avoids head-of-line blocking
+        on bursts of short calls. With cache_documents=True, repeated
+        get_document calls for the same (collection_id, document_id) are
+        served from a bounded in-process cache; local updates and deletes
+        invalidate their entry, but changes made elsewhere are not seen
+        until the entry is evicted, so leave it off when strict freshness
+        matters.
         """
         self.api_key = api_key
         self.app_client_token = token
+        self._http2 = http2
+        self._doc_cache = OrderedDict() if cache_documents else None
+        self._doc_cache_size = cache_size
+        headers = {
+            "x-api-key": api_key,
+            "Content-Type": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        }
+        if http2:
+            if httpx is None:
+                raise CocobaseError(
+                    "http2=True requires the httpx package (pip install 'cocobase[http2]')."
+                )
+            self._session = httpx.Client(
+                http2=True,
+                headers=headers,
+                limits=httpx.Limits(max_connections=10),
+            )
+            self._dispatch = None
+        else:
+            # One Session for the lifetime of the client so urllib3 keep-alive and
+            # the connection pool are reused instead of paying a TLS handshake per call.
+            self._session = Session()
+            self._session.headers.update(headers)
+            self._session.mount(
+                "https://", HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            )
+            # Resolve each HttpMethod to its bound session callable once, instead
+            # of walking an if/elif chain (and a membership check) per request.
+            self._dispatch = {
+                HttpMethod.get: self._session.get,
+                HttpMethod.post: self._session.post,
+                HttpMethod.delete: self._session.delete,
+                HttpMethod.patch: self._session.patch,
+            }
+
+    def close(self):
+        """
+        Close the underlying HTTP session and its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __request__(
         self,
@@ -28,34 +141,67 @@ class CocoBaseClient:
         method: HttpMethod = HttpMethod.get,
         data: dict | None = None,
         custom_headers: dict | None = None,
+        stream: bool = False,
     ) -> Response:
         """
         Internal method to send HTTP requests to the CocoBase API.
         Handles GET and POST methods, and allows custom headers.
         """
-        headers = {"x-api-key": self.api_key}
-        if not url.startswith("/"):
-            url = "/" + url
-        if custom_headers is not None:
-            headers.update(custom_headers)
-        if method not in (
-            HttpMethod.get,
-            HttpMethod.post,
-            HttpMethod.delete,
-            HttpMethod.patch,
-        ):
+        url = self._url(url)
+        if self._http2:
+            if not isinstance(method, HttpMethod):
+                raise ValueError(
+                    "Invalid HTTP method. Use HttpMethod.get, HttpMethod.post, HttpMethod.delete, or HttpMethod.patch."
+                )
+            body = None
+            if method is not HttpMethod.get and data is not None:
+                body = _dumps(data)
+                if len(body) > _GZIP_THRESHOLD:
+                    body = gzip.compress(body)
+                    custom_headers = dict(custom_headers) if custom_headers else {}
+                    custom_headers["Content-Encoding"] = "gzip"
+            return self._session.request(
+                method.value.upper(), url, headers=custom_headers, content=body
+            )
+        try:
+            send = self._dispatch[method]
+        except KeyError:
             raise ValueError(
                 "Invalid HTTP method. Use HttpMethod.get, HttpMethod.post, HttpMethod.delete, or HttpMethod.patch."
             )
-        url = BASEURL + url
-        if method == HttpMethod.get:
-            return get(url, headers=headers)
-        elif method == HttpMethod.delete:
-            return delete(url, headers=headers, json=data)  # Simulate delete if needed
-        elif method == HttpMethod.patch:
-            return patch(url, headers=headers, json=data)  # Simulate patch if needed
-        else:
-            return post(url, headers=headers, json=data)
+        if method is HttpMethod.get:
+            return send(url, headers=custom_headers, stream=stream)
+        body = _dumps(data) if data is not None else None
+        if body is not None and len(body) > _GZIP_THRESHOLD:
+            body = gzip.compress(body)
+            custom_headers = dict(custom_headers) if custom_headers else {}
+            custom_headers["Content-Encoding"] = "gzip"
+        return send(url, headers=custom_headers, data=body)
+
+    def _url(self, path: str) -> str:
+        """
+        Join a path onto the base URL. Every caller in this module already
+        passes a /-prefixed path, so the hot path is one concatenation.
+        """
+        if path.startswith("/"):
+            return _BASE + path
+        return _BASE + "/" + path
+
+    def _handle(self, req: Response, ok: set | None = None):
+        """
+        Raise CocobaseError for the shared error statuses; when the status is
+        in `ok`, return the parsed response body, otherwise None.
+        """
+        code = req.status_code
+        msg = _ERROR_MAP.get(code)
+        if msg is not None:
+            if code == 500:
+                raise CocobaseError(msg)
+            # Decoding req.text is deferred until the message is read.
+            raise CocobaseApiError(msg, req)
+        if ok is not None and code in ok:
+            return _loads(req.content)
+        return None
 
     # ------------------- COLLECTION METHODS -------------------
     def create_collection(
@@ -68,14 +214,8 @@ class CocoBaseClient:
         if webhookurl is not None:
             data["webhook_url"] = webhookurl
         req = self.__request__("/collections/", method=HttpMethod.post, data=data)
-        if req.status_code == 400:
-            raise CocobaseError("Invalid Request: " + req.text)
-        elif req.status_code == 422:
-            raise CocobaseError("A field is missing: " + req.text)
-        elif req.status_code == 500:
-            raise CocobaseError("Internal Server Error")
-        elif req.status_code == 201:
-            return Collection(req.json())
+        body = self._handle(req, {201})
+        return Collection(body) if body is not None else None
 
     def update_collection(
         self,
@@ -100,14 +240,7 @@ class CocoBaseClient:
         req = self.__request__(
             f"/collections/{collection_id}", method=HttpMethod.post, data=data
         )
-        if req.status_code == 400:
-            raise CocobaseError("Invalid Request: " + req.text)
-        elif req.status_code == 422:
-            raise CocobaseError("A field is missing: " + req.text)
-        elif req.status_code == 500:
-            raise CocobaseError("Internal Server Error")
-        elif req.status_code == 200:
-            return req.json()
+        return self._handle(req, {200})
 
     def delete_collection(self, collection_id):
         """
@@ -118,22 +251,20 @@ class CocoBaseClient:
         req = self.__request__(
             f"/collections/{collection_id}", method=HttpMethod.delete
         )
-        if req.status_code == 400:
-            raise CocobaseError("Invalid Request: " + req.text)
-        elif req.status_code == 422:
-            raise CocobaseError("A field is missing: " + req.text)
-        elif req.status_code == 500:
-            raise CocobaseError("Internal Server Error")
-        elif req.status_code == 204:
+        self._handle(req)
+        if req.status_code == 204:
             return True
         else:
             print("Unexpected status code:", req.status_code)
             print("Response text:", req.text)
 
     # ------------------- DOCUMENT METHODS -------------------
-    def create_document(self, collection_id, data: dict) -> Record | None:
+    def create_document(
+        self, collection_id, data: dict, raw: bool = False
+    ) -> Record | dict | None:
         """
-        Create a new document in a collection.
+        Create a new document in a collection. With raw=True the parsed
+        response dict is returned as-is, skipping the Record wrapper.
         """
         if collection_id is None:
             raise CocobaseError("Collection ID must be provided.")
@@ -144,20 +275,86 @@ class CocoBaseClient:
             method=HttpMethod.post,
             data={"data": data},
         )
-        if req.status_code == 400:
-            raise CocobaseError("Invalid Request: " + req.text)
-        elif req.status_code == 422:
-            raise CocobaseError("A field is missing: " + req.text)
-        elif req.status_code == 500:
-            raise CocobaseError("Internal Server Error")
-        elif req.status_code == 201:
-            return Record(req.json())
+        body = self._handle(req, {201})
+        if raw:
+            return body
+        return Record(body) if body is not None else None
 
-    def list_documents(
+    def iter_documents(self, collection_id, query: QueryBuilder | None = None):
+        """
+        Stream documents in a collection, yielding each Record as it is parsed.
+        Memory stays bounded by one record instead of the whole response, and
+        callers that only need the first N results can simply break early.
+        """
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        if query is not None and not isinstance(query, QueryBuilder):
+            raise CocobaseError("Query must be an instance of QueryBuilder.")
+        url = (
+            f"/collections/{collection_id}/documents?{query.build()}"
+            if query is not None
+            else f"/collections/{collection_id}/documents"
+        )
+        req = self.__request__(url, stream=True)
+        self._handle(req)
+        if req.status_code == 200:
+            if ijson is not None and not self._http2:
+                req.raw.decode_content = True
+                for doc in ijson.items(req.raw, "item"):
+                    yield Record(doc)
+            else:
+                # Without ijson (or on the httpx transport, which exposes no
+                # raw file-like body), fall back to parsing the full body.
+                for doc in _loads(req.content):
+                    yield Record(doc)
+
+    def iter_documents_ndjson(
         self, collection_id, query: QueryBuilder | None = None
-    ) -> list[Record] | None:
+    ):
+        """
+        Stream documents as JSON Lines (application/x-ndjson), yielding a
+        Record per line. Each line is an independent JSON object, so memory
+        stays bounded and parsing overlaps with the download. Falls back to
+        the JSON array path when the server answers with application/json.
+        """
+        if collection_id is None:
+            raise CocobaseError("Collection ID must be provided.")
+        if query is not None and not isinstance(query, QueryBuilder):
+            raise CocobaseError("Query must be an instance of QueryBuilder.")
+        url = (
+            f"/collections/{collection_id}/documents?{query.build()}"
+            if query is not None
+            else f"/collections/{collection_id}/documents"
+        )
+        req = self.__request__(
+            url,
+            custom_headers={"Accept": "application/x-ndjson"},
+            stream=True,
+        )
+        self._handle(req)
+        if req.status_code == 200:
+            if "application/x-ndjson" in req.headers.get("Content-Type", ""):
+                lines = (
+                    req.iter_lines()
+                    if self._http2
+                    else req.iter_lines(decode_unicode=False)
+                )
+                for line in lines:
+                    if line:
+                        yield Record(_loads(line))
+            else:
+                for doc in _loads(req.content):
+                    yield Record(doc)
+
+    def list_documents(
+        self, collection_id, query: QueryBuilder | None = None, raw: bool = False
+    ) -> list[Record] | list[dict] | None:
         """
         List all documents in a collection, optionally filtered by a query.
+        Materializes the full list; use iter_documents to stream instead.
+        With raw=True the parsed dicts are returned without Record wrapping,
+        which avoids one object allocation per document on hot bulk reads
+        (typed accessors are unavailable in raw mode).
         """
         if collection_id is None:
             raise CocobaseError("Collection ID must be provided.")
@@ -169,32 +366,44 @@ class CocoBaseClient:
             else f"/collections/{collection_id}/documents"
         )
         req = self.__request__(url)
-        if req.status_code == 400:
-            raise CocobaseError("Invalid Request: " + req.text)
-        elif req.status_code == 422:
-            raise CocobaseError("A field is missing: " + req.text)
-        elif req.status_code == 500:
-            raise CocobaseError("Internal Server Error")
-        elif req.status_code == 200:
-            return [Record(doc) for doc in req.json()]
+        body = self._handle(req, {200})
+        if raw:
+            return body
+        return Record.from_iter(body) if body is not None else None
 
-    def get_document(self, collection_id, document_id) -> Record | None:
+    def get_document(
+        self, collection_id, document_id, raw: bool = False
+    ) -> Record | dict | None:
         """
-        Retrieve a single document by its ID from a collection.
+        Retrieve a single document by its ID from a collection. With raw=True
+        the parsed response dict is returned as-is, skipping the Record wrapper.
         """
         if collection_id is None:
             raise CocobaseError("Collection ID must be provided.")
         if document_id is None:
             raise CocobaseError("Document ID must be provided.")
+        cache = self._doc_cache
+        key = (collection_id, document_id)
+        if cache is not None and key in cache:
+            cache.move_to_end(key)
+            body = cache[key]
+            return body if raw else Record(body)
         req = self.__request__(f"/collections/{collection_id}/documents/{document_id}")
-        if req.status_code == 400:
-            raise CocobaseError("Invalid Request: " + req.text)
-        elif req.status_code == 422:
-            raise CocobaseError("A field is missing: " + req.text)
-        elif req.status_code == 500:
-            raise CocobaseError("Internal Server Error")
-        elif req.status_code == 200:
-            return Record(req.json())
+        body = self._handle(req, {200})
+        if cache is not None and body is not None:
+            cache[key] = body
+            if len(cache) > self._doc_cache_size:
+                cache.popitem(last=False)
+        if raw:
+            return body
+        return Record(body) if body is not None else None
+
+    def invalidate_document(self, collection_id, document_id):
+        """
+        Drop a document's cached get_document entry, if caching is enabled.
+        """
+        if self._doc_cache is not None:
+            self._doc_cache.pop((collection_id, document_id), None)
 
     def delete_document(self, collection_id, document_id) -> bool:
         """
@@ -208,19 +417,18 @@ class CocoBaseClient:
             f"/collections/{collection_id}/documents/{document_id}",
             method=HttpMethod.delete,
         )
-        if req.status_code == 400:
-            raise CocobaseError("Invalid Request: " + req.text)
-        elif req.status_code == 422:
-            raise CocobaseError("A field is missing: " + req.text)
-        elif req.status_code == 500:
-            raise CocobaseError("Internal Server Error")
-        elif req.status_code == 200 or req.status_code == 204:
+        self._handle(req)
+        if req.status_code == 200 or req.status_code == 204:
+            self.invalidate_document(collection_id, document_id)
             return True
         return False
 
-    def update_document(self, collection_id, document_id, data: dict) -> Record | None:
+    def update_document(
+        self, collection_id, document_id, data: dict, raw: bool = False
+    ) -> Record | dict | None:
         """
-        Update a document in a collection by its ID.
+        Update a document in a collection by its ID. With raw=True the parsed
+        response dict is returned as-is, skipping the Record wrapper.
         """
         if collection_id is None:
             raise CocobaseError("Collection ID must be provided.")
@@ -233,14 +441,49 @@ class CocoBaseClient:
             method=HttpMethod.patch,
             data={"data": data},
         )
-        if req.status_code == 400:
-            raise CocobaseError("Invalid Request: " + req.text)
-        elif req.status_code == 422:
-            raise CocobaseError("A field is missing: " + req.text)
-        elif req.status_code == 500:
-            raise CocobaseError("Internal Server Error")
-        elif req.status_code == 200:
-            return Record(req.json())
+        body = self._handle(req, {200})
+        if body is not None:
+            self.invalidate_document(collection_id, document_id)
+        if raw:
+            return body
+        return Record(body) if body is not None else None
+
+    # ------------------- BULK DOCUMENT METHODS -------------------
+    def bulk_create_documents(
+        self, collection_id, docs, workers: int = 16
+    ) -> list[Record | None]:
+        """
+        Create many documents concurrently over the shared Session. Threads
+        overlap the network round-trips, so N creates take roughly N/workers
+        round-trips of wall time instead of N. Results keep the input order.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(lambda d: self.create_document(collection_id, d), docs))
+
+    def bulk_update_documents(
+        self, collection_id, updates, workers: int = 16
+    ) -> list[Record | None]:
+        """
+        Update many documents concurrently. `updates` is an iterable of
+        (document_id, data) pairs. Results keep the input order.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(
+                ex.map(
+                    lambda u: self.update_document(collection_id, u[0], u[1]), updates
+                )
+            )
+
+    def bulk_delete_documents(
+        self, collection_id, document_ids, workers: int = 16
+    ) -> list[bool]:
+        """
+        Delete many documents concurrently. Results keep the input order.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(
+                ex.map(lambda i: self.delete_document(collection_id, i), document_ids)
+            )
 
     # ------------------- AUTHENTICATION METHODS -------------------
     def set_app_client_token(self, app_client_token: str):
@@ -271,10 +514,11 @@ class CocoBaseClient:
             data=post_data,
         )
         if req.status_code == 200:
-            self.set_app_client_token(req.json().get("access_token"))
-            return req.json().get("access_token") is not None
+            token = _loads(req.content).get("access_token")
+            self.set_app_client_token(token)
+            return token is not None
         else:
-            raise CocobaseError("Registration failed: " + req.text)
+            raise CocobaseApiError("Registration failed: ", req)
 
     def login(self, email: str, password: str) -> bool:
         """
@@ -286,10 +530,11 @@ class CocoBaseClient:
             data={"email": email, "password": password},
         )
         if req.status_code == 200:
-            self.set_app_client_token(req.json().get("access_token"))
-            return req.json().get("access_token") is not None
+            token = _loads(req.content).get("access_token")
+            self.set_app_client_token(token)
+            return token is not None
         else:
-            raise CocobaseError("Login failed: " + req.text)
+            raise CocobaseApiError("Login failed: ", req)
 
     def logout(self):
         """
@@ -309,9 +554,9 @@ class CocoBaseClient:
             custom_headers={"Authorization": f"Bearer {self.app_client_token}"},
         )
         if req.status_code == 200:
-            return req.json()
+            return _loads(req.content)
         else:
-            raise CocobaseError("Failed to get user info: " + req.text)
+            raise CocobaseApiError("Failed to get user info: ", req)
 
     def update_user_info(self, email, password, data: dict) -> dict | None:
         """
@@ -335,6 +580,6 @@ class CocoBaseClient:
             custom_headers={"Authorization": f"Bearer {self.app_client_token}"},
         )
         if req.status_code == 200:
-            return req.json()
+            return _loads(req.content)
         else:
-            raise CocobaseError("Failed to update user info: " + req.text)
+            raise CocobaseApiError("Failed to update user info: ", req)
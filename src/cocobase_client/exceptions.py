@@ -4,4 +4,17 @@ class CocobaseError(Exception):
 class InvalidApiKeyError(CocobaseError):
     """Raised when the provided API key is invalid."""
     def __init__(self, message="Invalid API key provided."):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+class CocobaseApiError(CocobaseError):
+    """Raised for API error responses. Holds the response and only decodes its
+    body into the message when the message is actually read, so callers that
+    just catch and move on never pay for decoding a verbose error page."""
+    def __init__(self, prefix: str, response=None):
+        super().__init__(prefix)
+        self.prefix = prefix
+        self.response = response
+
+    def __str__(self):
+        if self.response is None:
+            return self.prefix
+        return self.prefix + self.response.text
\ No newline at end of file
@@ -1,40 +1,134 @@
+import sys
 from datetime import datetime
 from typing import Any, Optional
 
 
+# Hashed membership beats scanning a tuple, and the sets are built once at
+# import instead of per get_bool call.
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "t", "y", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "f", "n", "off"})
+
+
+def _str_to_bool(value: str) -> Optional[bool]:
+    # Optimistic check first: payloads are usually already lowercase.
+    if value in _TRUE_STRINGS:
+        return True
+    if value in _FALSE_STRINGS:
+        return False
+    val = value.strip().lower()
+    if val in _TRUE_STRINGS:
+        return True
+    if val in _FALSE_STRINGS:
+        return False
+    return bool(int(val))
+
+
+def _str_to_datetime(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.fromtimestamp(float(value))
+
+
+# Per-type conversion tables for the typed getters: one dict lookup on
+# type(value) replaces the isinstance chains, and the common exact-type hit
+# never pays exception-handler setup.
+_INT_CONV = {int: lambda v: v, bool: int, float: int, str: int}
+_FLOAT_CONV = {float: lambda v: v, int: float, bool: float, str: float}
+_BOOL_CONV = {
+    bool: lambda v: v,
+    int: bool,
+    float: lambda v: bool(int(v)),
+    str: _str_to_bool,
+}
+_DATETIME_CONV = {
+    datetime: lambda v: v,
+    int: datetime.fromtimestamp,
+    float: datetime.fromtimestamp,
+    str: _str_to_datetime,
+}
+
+
+def _parse_created_at(created_at) -> datetime:
+    """Convert a created_at value (datetime, timestamp, or ISO string) to a datetime."""
+    if isinstance(created_at, datetime):
+        return created_at
+    if isinstance(created_at, (int, float)):
+        return datetime.fromtimestamp(created_at)
+    if isinstance(created_at, str):
+        try:
+            # Try ISO format first
+            return datetime.fromisoformat(created_at)
+        except ValueError:
+            try:
+                # Try as float timestamp string
+                return datetime.fromtimestamp(float(created_at))
+            except Exception:
+                return datetime.fromtimestamp(0)
+    return datetime.fromtimestamp(0)
+
+
 class Record:
     """A class representing a record in a database, allowing for dictionary-like access with typed getters."""
 
-    data: dict
-    id: str
-    collectionId: str
-    createdAt: datetime
-    collection: dict
+    # Slots avoid a per-instance __dict__, which adds up to real memory on
+    # large list_documents responses and makes attribute access a dict probe.
+    __slots__ = (
+        "data",
+        "id",
+        "collectionId",
+        "collection",
+        "_created_at_raw",
+        "_createdAt",
+    )
 
     def __init__(self, data: dict):
         self.data = data.get("data", {})
         self.id = data.get("id", "")
-        self.collectionId = data.get("collection_id", "")
-        created_at = data.get("created_at", 0)
-        # Handle string, int, float, or ISO format for created_at
-        if isinstance(created_at, datetime):
-            self.createdAt = created_at
-        elif isinstance(created_at, (int, float)):
-            self.createdAt = datetime.fromtimestamp(created_at)
-        elif isinstance(created_at, str):
-            try:
-                # Try ISO format first
-                self.createdAt = datetime.fromisoformat(created_at)
-            except ValueError:
-                try:
-                    # Try as float timestamp string
-                    self.createdAt = datetime.fromtimestamp(float(created_at))
-                except Exception:
-                    self.createdAt = datetime.fromtimestamp(0)
-        else:
-            self.createdAt = datetime.fromtimestamp(0)
+        # Interned so the thousands of Records from one listing share a single
+        # collection-id string object instead of carrying their own copies.
+        self.collectionId = sys.intern(data.get("collection_id") or "")
+        self._created_at_raw = data.get("created_at", 0)
+        self._createdAt = None
         self.collection = data.get("collection", {})
 
+    @classmethod
+    def from_iter(cls, docs, intern_keys: bool = False) -> list:
+        """
+        Batch-construct Records from an iterable of raw document dicts.
+        Faster than a Record(...) comprehension on large listings: the
+        constructor bindings are hoisted out of the loop and each dict's
+        get method is bound once. With intern_keys=True the keys of each
+        record's data dict are interned too, deduplicating field names
+        that repeat across every record.
+        """
+        new = cls.__new__
+        intern = sys.intern
+        out = []
+        append = out.append
+        for d in docs:
+            r = new(cls)
+            get = d.get
+            data = get("data") or {}
+            if intern_keys and data:
+                data = {intern(k): v for k, v in data.items()}
+            r.data = data
+            r.id = get("id", "")
+            r.collectionId = intern(get("collection_id") or "")
+            r._created_at_raw = get("created_at", 0)
+            r._createdAt = None
+            r.collection = get("collection") or {}
+            append(r)
+        return out
+
+    @property
+    def createdAt(self) -> datetime:
+        # Parsed lazily (and cached in a slot, since cached_property needs a
+        # __dict__): many callers never read the timestamp at all.
+        if self._createdAt is None:
+            self._createdAt = _parse_created_at(self._created_at_raw)
+        return self._createdAt
+
     def __repr__(self):
         return f"Record({self.data})"
 
@@ -59,8 +153,12 @@ class Record:
 
     def get_string(self, key: str, raise_error: bool = False) -> Optional[str]:
         value = self.data.get(key)
+        if value is None:
+            return None
+        if type(value) is str:
+            return value
         try:
-            return str(value) if value is not None else None
+            return str(value)
         except Exception:
             if raise_error:
                 raise TypeError(f"Value for '{key}' is not string-convertible: {value}")
@@ -70,8 +168,9 @@ class Record:
         value = self.data.get(key)
         if value is None:
             return None
+        conv = _INT_CONV.get(type(value), int)
         try:
-            return int(value)
+            return conv(value)
         except Exception:
             if raise_error:
                 raise TypeError(f"Value for '{key}' is not int-convertible: {value}")
@@ -81,8 +180,9 @@ class Record:
         value = self.data.get(key)
         if value is None:
             return None
+        conv = _FLOAT_CONV.get(type(value), float)
         try:
-            return float(value)
+            return conv(value)
         except Exception:
             if raise_error:
                 raise TypeError(f"Value for '{key}' is not float-convertible: {value}")
@@ -92,15 +192,10 @@ class Record:
         value = self.data.get(key)
         if value is None:
             return None
+        conv = _BOOL_CONV.get(type(value))
         try:
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                val = value.strip().lower()
-                if val in ("true", "1", "yes"):
-                    return True
-                if val in ("false", "0", "no"):
-                    return False
+            if conv is not None:
+                return conv(value)
             return bool(int(value))  # for numeric truthiness
         except Exception:
             if raise_error:
@@ -109,18 +204,12 @@ class Record:
 
     def get_datetime(self, key: str, raise_error: bool = False) -> Optional[datetime]:
         value = self.data.get(key)
-        try:
-            if isinstance(value, datetime):
-                return value
-            if isinstance(value, (int, float)):
-                return datetime.fromtimestamp(value)
-            if isinstance(value, str):
-                try:
-                    return datetime.fromisoformat(value)
-                except ValueError:
-                    return datetime.fromtimestamp(float(value))
-        except Exception:
-            pass
+        conv = _DATETIME_CONV.get(type(value))
+        if conv is not None:
+            try:
+                return conv(value)
+            except Exception:
+                pass
         if raise_error:
             raise TypeError(f"Value for '{key}' is not datetime-convertible: {value}")
         return None
@@ -136,24 +225,7 @@ class Collection:
     def __init__(self, data: dict):
         self.name = data.get("name", "")
         self.id = data.get("id", "")
-        created_at = data.get("created_at", 0)
-        # Handle string, int, float, or ISO format for created_at
-        if isinstance(created_at, datetime):
-            self.createdAt = created_at
-        elif isinstance(created_at, (int, float)):
-            self.createdAt = datetime.fromtimestamp(created_at)
-        elif isinstance(created_at, str):
-            try:
-                # Try ISO format first
-                self.createdAt = datetime.fromisoformat(created_at)
-            except ValueError:
-                try:
-                    # Try as float timestamp string
-                    self.createdAt = datetime.fromtimestamp(float(created_at))
-                except Exception:
-                    self.createdAt = datetime.fromtimestamp(0)
-        else:
-            self.createdAt = datetime.fromtimestamp(0)
+        self.createdAt = _parse_created_at(data.get("created_at", 0))
 
     def __repr__(self):
         return f"Collection(name={self.name}, id={self.id}, createdAt={self.createdAt})"